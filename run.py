@@ -1,48 +1,65 @@
 import argparse
-import csv
 import json
 import logging
+import logging.handlers
 import os
-import random
+import re
+import stat
 import sys
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+CHUNK_SIZE = 65536
+LOG_BUFFER_CAPACITY = 1024
+
+# Spellings float() reads as NaN; the csv-module loader accepted them as close values.
+_NAN_VALUES = [
+    sign + name for sign in ("", "+", "-") for name in ("nan", "naN", "nAn", "nAN", "Nan", "NaN", "NAn", "NAN")
+]
+
+# Dekker's splitter for float64: splits a value into halves whose pairwise products are exact.
+# Values above _SPLIT_LIMIT are scaled down by _SPLIT_SCALE first so _SPLITTER * a cannot overflow.
+_SPLITTER = 134217729.0
+_SPLIT_LIMIT = 2.0 ** 996
+_SPLIT_SCALE = 2.0 ** 28
+_EPS = float(np.finfo(np.float64).eps)
+
+# One match per non-blank line: a comment, a "key: value" pair, or an invalid line without ':'.
+_YAML_LINE = re.compile(
+    r"^[ \t]*(?:#.*|(?P<key>[^:\n]*?)[ \t]*:[ \t]*(?P<value>.*?)|(?P<invalid>\S.*?))[ \t]*$",
+    re.MULTILINE,
+)
 
 
 class PipelineError(Exception):
     """Domain-specific pipeline error."""
 
 
-def parse_simple_yaml(path: str) -> Dict[str, Any]:
-    """Parse a simple key: value YAML file with quoted string and integer support.
-    Inputs: path (str) - file path to YAML configuration file.
-    Output: Dict[str, Any] - dictionary of parsed key-value pairs.
-    Raises: PipelineError if file structure is invalid.
-    """
-    data: Dict[str, Any] = {}
-    with open(path, "r", encoding="utf-8") as f:
-        for raw_line in f:
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if ":" not in line:
-                raise PipelineError("Invalid configuration file structure")
-            key, value = line.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-            elif value.isdigit() or (value.startswith("-") and value[1:].isdigit()):
-                value = int(value)
-            data[key] = value
-    return data
+class Config(NamedTuple):
+    """Validated pipeline configuration."""
 
+    seed: int
+    window: int
+    version: str
 
-def setup_logger(log_file: str) -> logging.Logger:
-    """Configure and return a logger that writes to both file and stdout.
-    Inputs: log_file (str) - path where log output will be written.
+
+def setup_logger(log_file: str, echo_stdout: bool = True) -> logging.Logger:
+    """Configure and return a logger that writes to file and, optionally, stdout.
+    Inputs: log_file (str) - path where log output will be written,
+            echo_stdout (bool) - also attach a stdout handler (disabled by --quiet).
     Output: logging.Logger - configured logger instance.
     Format: timestamp - level - message.
+    File records are buffered in a MemoryHandler and written in batches; the buffer is
+    flushed on ERROR records and when main() finishes.
     """
     logger = logging.getLogger("mlops_task")
     logger.setLevel(logging.INFO)
@@ -51,146 +68,398 @@ def setup_logger(log_file: str) -> logging.Logger:
 
     file_handler = logging.FileHandler(log_file)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-
-    stream_handler = logging.StreamHandler(sys.stdout)
-    stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+    logger.addHandler(
+        logging.handlers.MemoryHandler(LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler)
+    )
+
+    if echo_stdout:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+        logger.addHandler(stream_handler)
     return logger
 
 
-def write_json(path: str, payload: Dict[str, Any]) -> None:
+def dumps_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize a dictionary to 2-space indented UTF-8 JSON, using orjson when it is installed.
+    Inputs: payload (Dict) - data to serialize.
+    Output: bytes - encoded JSON document.
+    Falls back to the stdlib json module for payloads orjson cannot encode.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers outside the 64-bit range, which the stdlib encodes fine
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json(path: str, payload: Dict[str, Any]) -> bytes:
     """Write a dictionary as JSON to file with 2-space indentation.
     Inputs: path (str) - destination file path, payload (Dict) - data to serialize.
-    Output: None - writes JSON file to disk with pretty formatting.
+    Output: bytes - the serialized document, so callers can reuse it without re-encoding.
     """
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    data = dumps_json(payload)
+    with open(path, "wb") as f:
+        f.write(data)
+    return data
 
 
-def load_and_validate_config(config_path: str) -> Dict[str, Any]:
-    """Load and validate YAML config file, ensuring required fields and types.
+def echo_json(data: bytes) -> None:
+    """Write already-serialized JSON bytes to stdout followed by a newline.
+    Inputs: data (bytes) - encoded JSON document, typically returned by write_json.
+    Output: None - flushes pending text output first so log and JSON lines stay ordered.
+    """
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8") + "\n")
+        return
+    buffer.write(data + b"\n")
+    buffer.flush()
+
+
+def _parse_int_literal(value: str) -> int:
+    """Parse an unquoted, optionally negative integer literal.
+    Inputs: value (str) - raw config value text.
+    Output: int - parsed integer.
+    Raises: ValueError if value is not an integer literal.
+    """
+    if value.isdigit() or (value.startswith("-") and value[1:].isdigit()):
+        return int(value)
+    raise ValueError(value)
+
+
+def _parse_string_literal(value: str) -> str:
+    """Parse a quoted or bare string value; bare integer literals are rejected.
+    Inputs: value (str) - raw config value text.
+    Output: str - value with surrounding double quotes removed.
+    Raises: ValueError if value is a bare integer literal.
+    """
+    if value.startswith('"') and value.endswith('"'):
+        return value[1:-1]
+    if value.isdigit() or (value.startswith("-") and value[1:].isdigit()):
+        raise ValueError(value)
+    return value
+
+
+REQUIRED_KEYS: Tuple[str, ...] = ("seed", "window", "version")
+
+
+def load_config(config_path: str) -> Config:
+    """Load and validate the seed/window/version config file in a single scan.
     Inputs: config_path (str) - path to configuration file.
-    Output: Dict[str, Any] - validated config with seed (int), window (int), version (str).
-    Raises: PipelineError if file missing, unreadable, or validation fails.
+    Output: Config - validated config with seed (int), window (int), version (str).
+    Raises: PipelineError if file missing, unreadable, malformed, or validation fails.
+    Lines are matched against _YAML_LINE; only keys in REQUIRED_KEYS are kept.
     """
-    if not os.path.isfile(config_path):
+    try:
+        st = os.stat(config_path)
+    except OSError as exc:
+        raise PipelineError("Configuration file not found") from exc
+    if not stat.S_ISREG(st.st_mode):
         raise PipelineError("Configuration file not found")
 
     try:
-        config = parse_simple_yaml(config_path)
+        with open(config_path, "r", encoding="utf-8") as f:
+            text = f.read()
     except OSError as exc:
         raise PipelineError("Unable to read configuration file") from exc
 
-    required_keys = ["seed", "window", "version"]
-    missing = [k for k in required_keys if k not in config]
+    raw: Dict[str, str] = {}
+    for match in _YAML_LINE.finditer(text):
+        if match.group("invalid") is not None:
+            raise PipelineError("Invalid configuration file structure")
+        key = match.group("key")
+        if key in REQUIRED_KEYS:
+            raw[key] = match.group("value")
+
+    missing = [k for k in REQUIRED_KEYS if k not in raw]
     if missing:
         raise PipelineError(f"Config has missing keys: {missing}")
 
-    seed = config["seed"]
-    window = config["window"]
-    version = config["version"]
+    try:
+        seed: int = _parse_int_literal(raw["seed"])
+    except ValueError as exc:
+        raise PipelineError("Invalid configuration file structure: 'seed' must be an integer") from exc
 
-    if not isinstance(seed, int):
-        raise PipelineError("Invalid configuration file structure: 'seed' must be an integer")
-    if not isinstance(window, int) or window <= 0:
+    try:
+        window: int = _parse_int_literal(raw["window"])
+    except ValueError as exc:
+        raise PipelineError("Invalid configuration file structure: 'window' must be a positive integer") from exc
+    if window <= 0:
         raise PipelineError("Invalid configuration file structure: 'window' must be a positive integer")
-    if not isinstance(version, str) or not version:
+
+    try:
+        version: str = _parse_string_literal(raw["version"])
+    except ValueError as exc:
+        raise PipelineError("Invalid configuration file structure: 'version' must be a non-empty string") from exc
+    if not version:
         raise PipelineError("Invalid configuration file structure: 'version' must be a non-empty string")
 
-    return {"seed": seed, "window": window, "version": version}
+    return Config(seed=seed, window=window, version=version)
 
 
-def load_and_validate_data(input_path: str) -> List[Dict[str, Any]]:
-    """Load and validate CSV file, ensuring 'close' column exists with numeric values.
-    Inputs: input_path (str) - path to CSV file.
-    Output: List[Dict[str, Any]] - list of row dictionaries with 'close' as float.
-    Raises: PipelineError if file missing, empty, invalid format, or missing 'close'.
+def load_and_validate_data(input_path: str, chunksize: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """Validate the CSV file and header, then return an iterator over its 'close' chunks.
+    Inputs: input_path (str) - path to CSV file, chunksize (int) - rows parsed per chunk.
+    Output: Iterator[np.ndarray] - float64 'close' values, one array per chunk.
+    Raises: PipelineError at call time if file missing, unreadable, empty, invalid format,
+    or missing 'close'; the returned iterator raises for bad values or no data rows.
     """
-    if not os.path.isfile(input_path):
+    try:
+        st = os.stat(input_path)
+    except OSError as exc:
+        raise PipelineError("Missing input file") from exc
+    if not stat.S_ISREG(st.st_mode):
         raise PipelineError("Missing input file")
     if not os.access(input_path, os.R_OK):
         raise PipelineError("Input file is not readable")
 
-    if os.path.getsize(input_path) == 0:
+    if st.st_size == 0:
         raise PipelineError("Empty input file")
 
     try:
-        with open(input_path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            if reader.fieldnames is None:
-                raise PipelineError("Empty input file")
-            if "close" not in reader.fieldnames:
-                raise PipelineError("Missing required columns: close")
-
-            rows: List[Dict[str, Any]] = []
-            for row in reader:
-                row_copy = dict(row)
-                try:
-                    row_copy["close"] = float(row_copy["close"])
-                except (TypeError, ValueError) as exc:
-                    raise PipelineError("Invalid close value: must be numeric") from exc
-                rows.append(row_copy)
-    except PipelineError:
-        raise
+        header: pd.DataFrame = pd.read_csv(
+            input_path, header=None, nrows=1, dtype=str, keep_default_na=False, encoding="utf-8"
+        )
+    except pd.errors.EmptyDataError as exc:
+        raise PipelineError("Empty input file") from exc
+    except Exception as exc:
+        raise PipelineError("Invalid CSV file format") from exc
+    names: List[str] = header.iloc[0].tolist()
+    if "close" not in names:
+        raise PipelineError("Missing required columns: close")
+
+    # Like csv.DictReader, a repeated 'close' header resolves to its last column.
+    close_index = len(names) - 1 - names[::-1].index("close")
+    return _iter_close_chunks(input_path, close_index, chunksize)
+
+
+def _iter_close_chunks(input_path: str, close_index: int, chunksize: int) -> Iterator[np.ndarray]:
+    """Parse the 'close' column of an already validated CSV file chunk by chunk.
+    Inputs: input_path (str) - path to CSV file, close_index (int) - position of the 'close'
+    column, chunksize (int) - rows parsed per chunk.
+    Output: Iterator[np.ndarray] - float64 'close' values, one array per chunk.
+    Raises: PipelineError if a row is malformed, a value is non-numeric, or there are no data rows.
+    """
+    rows_processed = 0
+    try:
+        with pd.read_csv(
+            input_path,
+            usecols=[close_index],
+            dtype="float64",
+            keep_default_na=False,
+            na_values=_NAN_VALUES,
+            index_col=False,
+            encoding="utf-8",
+            chunksize=chunksize,
+        ) as reader:
+            for chunk in reader:
+                rows_processed += len(chunk)
+                yield chunk.iloc[:, 0].to_numpy()
+    except (pd.errors.ParserError, UnicodeDecodeError) as exc:
+        raise PipelineError("Invalid CSV file format") from exc
+    except ValueError as exc:
+        raise PipelineError("Invalid close value: must be numeric") from exc
     except Exception as exc:
         raise PipelineError("Invalid CSV file format") from exc
 
-    if not rows:
+    if rows_processed == 0:
         raise PipelineError("Empty input file")
-    return rows
 
 
-def compute_signals(closes: List[float], window: int) -> List[int]:
-    """Generate binary signals based on rolling mean comparison using streaming algorithm.
-    Inputs: closes (List[float]) - price data, window (int) - rolling window size.
-    Output: List[int] - binary signals (1 if close > rolling_mean, else 0).
+def _two_sum(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Add two arrays, keeping the rounding error of each sum.
+    Inputs: a, b (np.ndarray) - float64 addends.
+    Output: Tuple[np.ndarray, np.ndarray] - rounded sums and their exact rounding errors.
+    """
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+
+def _two_product(a: np.ndarray, b: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Multiply an array by a scalar, keeping the rounding error of each product.
+    Inputs: a (np.ndarray) - float64 factors, b (float) - scalar factor below _SPLIT_LIMIT.
+    Output: Tuple[np.ndarray, np.ndarray] - rounded products and their exact rounding errors.
+    """
+    scale: Any = 1.0
+    large = np.abs(a) > _SPLIT_LIMIT
+    if large.any():
+        # Power-of-two scaling is exact, so the split and the error terms are unchanged.
+        scale = np.where(large, _SPLIT_SCALE, 1.0)
+        a = a / scale
+    x = a * b
+    t = _SPLITTER * a
+    a_hi = t - (t - a)
+    a_lo = a - a_hi
+    t = _SPLITTER * b
+    b_hi = t - (t - b)
+    b_lo = b - b_hi
+    return x * scale, (((a_hi * b_hi - x) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo) * scale
+
+
+def _extend_prefixes(c: np.ndarray, prefixes: np.ndarray) -> None:
+    """Continue the compensated prefix sums over one run of closes.
+    Inputs: c (np.ndarray) - float64 price data, prefixes (np.ndarray) - (3, len(c) + 1) view whose
+    first column holds the running sum, its accumulated rounding error, and the running sum of |c|.
+    Output: None - fills prefixes[:, 1:] in place.
+    Each row is one sequential cumsum, so extending chunk by chunk gives the same bits as one pass.
+    """
+    prefix, error_prefix, abs_prefix = prefixes
+    prefix[1:] = c
+    np.cumsum(prefix, out=prefix)
+    error_prefix[1:] = _two_sum(prefix[:-1], c)[1]
+    np.cumsum(error_prefix, out=error_prefix)
+    np.abs(c, out=abs_prefix[1:])
+    np.cumsum(abs_prefix, out=abs_prefix)
+
+
+def _window_margins(closes: np.ndarray, prefixes: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute close * window - window_sum for each close ending a full window, with its tie tolerance.
+    Inputs: closes (np.ndarray) - float64 closes ending each window, prefixes (np.ndarray) -
+    (3, len(closes) + window) compensated prefix sums up to those closes, window (int) - rolling window size.
+    Output: Tuple[np.ndarray, np.ndarray] - margins and tolerances, one per close.
+    Margins within the tolerance are no larger than the error float64 parsing can introduce,
+    so they are treated as ties and do not count as close > rolling_mean; this also applies to
+    closes that differ only below float64 input precision (adjacent floats).
+    """
+    prefix, error_prefix, abs_prefix = prefixes
+    sums, sum_errors = _two_sum(prefix[window:], -prefix[:-window])
+    sum_errors += error_prefix[window:] - error_prefix[:-window]
+    scaled, scaled_errors = _two_product(closes, float(window))
+    margins = (scaled - sums) + (scaled_errors - sum_errors)
+    tolerances = _EPS * (np.abs(scaled) + (abs_prefix[window:] - abs_prefix[:-window]))
+    return margins, tolerances
+
+
+def _signal_margins(c: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute margins and tie tolerances for every full window of one array.
+    Inputs: c (np.ndarray) - float64 price data of length >= window, window (int) - rolling window size.
+    Output: Tuple[np.ndarray, np.ndarray] - margins and tolerances for rows window-1 onward.
+    Window sums are differences of compensated prefix sums anchored at c[0], so the cost is O(n)
+    for any window.
+    """
+    prefixes = np.zeros((3, len(c) + 1), dtype=np.float64)
+    _extend_prefixes(c, prefixes)
+    return _window_margins(c[window - 1:], prefixes, window)
+
+
+def compute_signals(closes: np.ndarray, window: int) -> np.ndarray:
+    """Generate binary signals based on rolling mean comparison using compensated prefix sums.
+    Inputs: closes (np.ndarray) - float64 price data, window (int) - rolling window size.
+    Output: np.ndarray - int8 binary signals (1 if close > rolling_mean, else 0).
     Pre-window values are padded with 0 before sufficient data accumulates.
     """
-    signals: List[int] = []
-    running_sum = 0.0
-    buffer: List[float] = []
+    c = np.asarray(closes, dtype=np.float64)
+    signals = np.zeros(len(c), dtype=np.int8)
+    if len(c) < window:
+        return signals
+
+    margins, tolerances = _signal_margins(c, window)
+    np.greater(margins, tolerances, out=signals[window - 1:])
+    return signals
+
+
+def compute_signal_count(closes: np.ndarray, window: int) -> int:
+    """Count rolling mean signals without materializing the per-row signal array.
+    Inputs: closes (np.ndarray) - float64 price data, window (int) - rolling window size.
+    Output: int - number of rows where close > rolling_mean once the window is full.
+    """
+    c = np.asarray(closes, dtype=np.float64)
+    if len(c) < window:
+        return 0
 
-    for close in closes:
-        buffer.append(close)
-        running_sum += close
+    margins, tolerances = _signal_margins(c, window)
+    return int(np.count_nonzero(margins > tolerances))
 
-        if len(buffer) > window:
-            running_sum -= buffer.pop(0)
 
-        if len(buffer) < window:
-            signals.append(0)
+class RollingSignalState:
+    """Incremental rolling-signal fold that carries prefix-sum state across input chunks.
+    Inputs: window (int) - rolling window size.
+    Keeps the compensated prefix sums of the last min(window, rows seen + 1) rows, so each chunk
+    only costs work proportional to its own length and memory is O(chunk + min(window, rows)).
+    Exposes rows_processed and signal_count once all chunks have been folded in.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.window: int = window
+        self.prefixes: np.ndarray = np.zeros((3, 1), dtype=np.float64)
+        self.filled: int = 1
+        self.rows_processed: int = 0
+        self.signal_count: int = 0
+
+    def update(self, closes: np.ndarray) -> None:
+        """Fold one chunk of closes into the running totals.
+        Inputs: closes (np.ndarray) - float64 price data following the previous chunk.
+        Output: None - updates rows_processed, signal_count, and the carried prefix sums.
+        A row's window starts window prefix columns before its own, which the carried
+        columns cover without touching any earlier closes.
+        """
+        count = len(closes)
+        self._reserve(count)
+        start = self.filled
+        _extend_prefixes(closes, self.prefixes[:, start - 1:start + count])
+
+        # No window is full until window rows have been seen, so earlier rows count nothing.
+        first = max(0, self.window - 1 - self.rows_processed)
+        if first < count:
+            margins, tolerances = _window_margins(
+                closes[first:], self.prefixes[:, start + first - self.window:start + count], self.window
+            )
+            self.signal_count += int(np.count_nonzero(margins > tolerances))
+
+        self.filled = start + count
+        self.rows_processed += count
+
+    def _reserve(self, count: int) -> None:
+        """Make room for count more prefix columns, dropping columns no window can reach.
+        Inputs: count (int) - number of rows about to be appended.
+        Output: None - compacts or grows self.prefixes to at least 2 * kept + count columns,
+        so copying the kept columns is amortized over at least as many new rows.
+        """
+        if self.filled + count <= self.prefixes.shape[1]:
+            return
+        keep = min(self.window, self.filled)
+        kept = self.prefixes[:, self.filled - keep:self.filled]
+        if 2 * keep + count > self.prefixes.shape[1]:
+            grown = np.empty((3, 2 * keep + count), dtype=np.float64)
+            grown[:, :keep] = kept
+            self.prefixes = grown
         else:
-            rolling_mean = running_sum / window
-            signals.append(1 if close > rolling_mean else 0)
+            self.prefixes[:, :keep] = kept
+        self.filled = keep
 
-    return signals
+
+def run_streaming(input_path: str, window: int) -> Tuple[int, int]:
+    """Parse, convert, and fold the input in a single streaming pass over the file.
+    Inputs: input_path (str) - CSV file, window (int) - rolling window size.
+    Output: Tuple[int, int] - (rows_processed, signal_count).
+    Raises: PipelineError for any validation or parsing failures.
+    Each parsed chunk is folded into the rolling state before the next one is read.
+    """
+    state: RollingSignalState = RollingSignalState(window)
+    for closes in load_and_validate_data(input_path):
+        state.update(closes)
+    return state.rows_processed, state.signal_count
 
 
-def run_pipeline(input_path: str, config_path: str, logger: logging.Logger) -> Dict[str, Any]:
-    """Execute complete MLOps pipeline: load config, validate data, compute signals.
-    Inputs: input_path (str) - CSV file, config_path (str) - YAML config, logger (Logger).
+def run_pipeline(input_path: str, config: Config, logger: logging.Logger) -> Dict[str, Any]:
+    """Execute complete MLOps pipeline: validate data, compute signals from a loaded config.
+    Inputs: input_path (str) - CSV file, config (Config) - validated config, logger (Logger).
     Output: Dict[str, Any] - metrics dict with version, rows_processed, signal_rate, seed, status.
     Raises: PipelineError for any validation or processing failures.
     """
-    config: Dict[str, Any] = load_and_validate_config(config_path)
-    seed: int = config["seed"]
-    window: int = config["window"]
-    version: str = config["version"]
+    seed: int = config.seed
+    window: int = config.window
+    version: str = config.version
 
-    random.seed(seed)
     logger.info("Config loaded: seed=%s, window=%s, version=%s", seed, window, version)
 
-    rows: List[Dict[str, Any]] = load_and_validate_data(input_path)
-    rows_processed: int = len(rows)
-    logger.info("Data loaded: %s rows", rows_processed)
-
-    closes: List[float] = [row["close"] for row in rows]
-    logger.info("Rolling mean calculated with window=%s", window)
-    signals: List[int] = compute_signals(closes, window)
-    logger.info("Signals generated")
+    rows_processed, signal_count = run_streaming(input_path, window)
+    logger.info("Data processed: %s rows, %s signals", rows_processed, signal_count)
 
-    signal_rate: float = sum(signals) / rows_processed
+    signal_rate: float = signal_count / rows_processed
     logger.info("Metrics: signal_rate=%.4f, rows_processed=%s", signal_rate, rows_processed)
 
     return {
@@ -206,13 +475,14 @@ def run_pipeline(input_path: str, config_path: str, logger: logging.Logger) -> D
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments for the MLOps pipeline.
     Inputs: None (parses sys.argv).
-    Output: argparse.Namespace - parsed arguments (input, config, output, log-file).
+    Output: argparse.Namespace - parsed arguments (input, config, output, log-file, quiet).
     """
     parser = argparse.ArgumentParser(description="Mini MLOps batch pipeline")
     parser.add_argument("--input", required=True, help="Input CSV file path")
     parser.add_argument("--config", required=True, help="Configuration YAML file path")
     parser.add_argument("--output", required=True, help="Output metrics JSON file path")
     parser.add_argument("--log-file", required=True, help="Log file path")
+    parser.add_argument("--quiet", action="store_true", help="Write log records only to the log file, not stdout")
     return parser.parse_args()
 
 
@@ -224,36 +494,33 @@ def main() -> int:
     """
     args: argparse.Namespace = parse_args()
     start: float = time.time()
-    logger: logging.Logger = setup_logger(args.log_file)
+    logger: logging.Logger = setup_logger(args.log_file, echo_stdout=not args.quiet)
 
     logger.info("Job started")
 
+    version: str = "v1"
     try:
-        metrics: Dict[str, Any] = run_pipeline(args.input, args.config, logger)
+        config: Config = load_config(args.config)
+        version = config.version
+        metrics: Dict[str, Any] = run_pipeline(args.input, config, logger)
         latency_ms: int = int((time.time() - start) * 1000)
         metrics["latency_ms"] = latency_ms
 
-        write_json(args.output, metrics)
-        print(json.dumps(metrics, indent=2))
+        echo_json(write_json(args.output, metrics))
         logger.info("Job completed successfully in %sms", latency_ms)
         return 0
     except Exception as exc:
         logger.exception("Job failed: %s", exc)
-        version: str = "v1"
-        try:
-            cfg: Dict[str, Any] = load_and_validate_config(args.config)
-            version = cfg.get("version", "v1")
-        except Exception:
-            pass
-
         error_payload: Dict[str, Any] = {
             "version": version,
             "status": "error",
             "error_message": str(exc),
         }
-        write_json(args.output, error_payload)
-        print(json.dumps(error_payload, indent=2))
+        echo_json(write_json(args.output, error_payload))
         return 1
+    finally:
+        for handler in logger.handlers:
+            handler.flush()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,32 @@
+import contextlib
+import io
+import logging
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import run  # noqa: E402
+
+
+class PipelineRunMixin:
+    """Runs run.main() in-process and tears down the logger it configures."""
+
+    def reset_logger(self):
+        logger = logging.getLogger("mlops_task")
+        for handler in logger.handlers:
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
+        logger.handlers.clear()
+
+    def run_cmd(self, args):
+        stdout = io.StringIO()
+        try:
+            with patch.object(sys, "argv", ["run.py", *args]), contextlib.redirect_stdout(stdout):
+                returncode = run.main()
+        finally:
+            self.reset_logger()
+        return returncode, stdout.getvalue()
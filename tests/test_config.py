@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import run  # noqa: E402
+
+
+class LoadConfigTests(unittest.TestCase):
+    def load(self, text):
+        with tempfile.TemporaryDirectory() as td:
+            config = os.path.join(td, "config.yaml")
+            with open(config, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+            return run.load_config(config)
+
+    def assertConfigError(self, text, message):
+        with self.assertRaises(run.PipelineError) as ctx:
+            self.load(text)
+        self.assertEqual(str(ctx.exception), message)
+
+    def test_valid_configs(self):
+        cases = {
+            'seed: 42\nwindow: 5\nversion: "v1"\n': run.Config(42, 5, "v1"),
+            '# pipeline config\n\nseed: 42\n  # indented comment\nwindow: 5\nversion: "v1"\n': run.Config(42, 5, "v1"),
+            '  seed :  42  \n\twindow:5\nversion :   "v1"   \n': run.Config(42, 5, "v1"),
+            'seed: 42\r\nwindow: 5\r\nversion: "v1"\r\n': run.Config(42, 5, "v1"),
+            'seed: -7\nwindow: 5\nversion: "v1"\n': run.Config(-7, 5, "v1"),
+            "seed: 1\nwindow: 5\nversion: v2\n": run.Config(1, 5, "v2"),
+            'seed: 1\nwindow: 5\nversion: "a:b"\n': run.Config(1, 5, "a:b"),
+            "seed: 1\nwindow: 3\nwindow: 4\nversion: v\nextra: x\n": run.Config(1, 4, "v"),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.load(text), expected)
+
+    def test_line_without_colon(self):
+        self.assertConfigError("seed: 1\nwindow 5\nversion: v\n", "Invalid configuration file structure")
+
+    def test_missing_keys(self):
+        self.assertConfigError("seed: 1\nversion: v\n", "Config has missing keys: ['window']")
+
+    def test_invalid_seed(self):
+        for value in ['"42"', "4.2", "+5", "abc"]:
+            with self.subTest(seed=value):
+                self.assertConfigError(
+                    f"seed: {value}\nwindow: 5\nversion: v\n",
+                    "Invalid configuration file structure: 'seed' must be an integer",
+                )
+
+    def test_invalid_window(self):
+        for value in ["0", "-1", '"5"', "five"]:
+            with self.subTest(window=value):
+                self.assertConfigError(
+                    f"seed: 1\nwindow: {value}\nversion: v\n",
+                    "Invalid configuration file structure: 'window' must be a positive integer",
+                )
+
+    def test_invalid_version(self):
+        for value in ["42", "-3", '""', ""]:
+            with self.subTest(version=value):
+                self.assertConfigError(
+                    f"seed: 1\nwindow: 5\nversion: {value}\n",
+                    "Invalid configuration file structure: 'version' must be a non-empty string",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,12 @@
 import json
 import os
-import subprocess
 import tempfile
 import unittest
 
+from support import PipelineRunMixin
 
-class ErrorCaseTests(unittest.TestCase):
-    def run_cmd(self, args):
-        return subprocess.run(args, cwd=os.getcwd(), capture_output=True, text=True)
 
+class ErrorCaseTests(PipelineRunMixin, unittest.TestCase):
     def _load(self, p):
         with open(p, encoding='utf-8') as f:
             return json.load(f)
@@ -23,8 +21,8 @@ class ErrorCaseTests(unittest.TestCase):
                 f.write('seed: 42\nversion: "v1"\n')
             with open(data, 'w', encoding='utf-8') as f:
                 f.write('timestamp,close\n2024-01-01,10\n')
-            r = self.run_cmd(['python','run.py','--input',data,'--config',cfg,'--output',out,'--log-file',log])
-            self.assertNotEqual(r.returncode, 0)
+            returncode, _ = self.run_cmd(['--input',data,'--config',cfg,'--output',out,'--log-file',log])
+            self.assertNotEqual(returncode, 0)
             payload = self._load(out)
             self.assertEqual(payload['status'], 'error')
             self.assertIn('missing keys', payload['error_message'])
@@ -38,8 +36,8 @@ class ErrorCaseTests(unittest.TestCase):
             with open(cfg, 'w', encoding='utf-8') as f:
                 f.write('seed: 42\nwindow: 5\nversion: "v1"\n')
             open(data, 'w', encoding='utf-8').close()
-            r = self.run_cmd(['python','run.py','--input',data,'--config',cfg,'--output',out,'--log-file',log])
-            self.assertNotEqual(r.returncode, 0)
+            returncode, _ = self.run_cmd(['--input',data,'--config',cfg,'--output',out,'--log-file',log])
+            self.assertNotEqual(returncode, 0)
             payload = self._load(out)
             self.assertEqual(payload['status'], 'error')
             self.assertIn('Empty input file', payload['error_message'])
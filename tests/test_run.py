@@ -1,14 +1,20 @@
 import json
 import os
-import subprocess
+import sys
 import tempfile
 import unittest
+from fractions import Fraction
+from unittest.mock import patch
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-class RunPyIntegrationTests(unittest.TestCase):
-    def run_cmd(self, args, cwd):
-        return subprocess.run(args, cwd=cwd, capture_output=True, text=True)
+import numpy as np  # noqa: E402
 
+import run  # noqa: E402
+from support import PipelineRunMixin  # noqa: E402
+
+
+class RunPyIntegrationTests(PipelineRunMixin, unittest.TestCase):
     def load_json(self, path):
         with open(path, encoding="utf-8") as f:
             return json.load(f)
@@ -30,9 +36,7 @@ class RunPyIntegrationTests(unittest.TestCase):
                 f.write("2024-01-01 00:02:00,3,3,3,3,1,3\n")
                 f.write("2024-01-01 00:03:00,4,4,4,4,1,4\n")
 
-            res = self.run_cmd([
-                "python",
-                "run.py",
+            returncode, stdout = self.run_cmd([
                 "--input",
                 data,
                 "--config",
@@ -41,9 +45,9 @@ class RunPyIntegrationTests(unittest.TestCase):
                 out,
                 "--log-file",
                 log,
-            ], cwd=os.getcwd())
+            ])
 
-            self.assertEqual(res.returncode, 0, msg=res.stderr)
+            self.assertEqual(returncode, 0, msg=stdout)
             self.assertTrue(os.path.exists(out))
             self.assertTrue(os.path.exists(log))
 
@@ -53,6 +57,9 @@ class RunPyIntegrationTests(unittest.TestCase):
             self.assertEqual(payload["metric"], "signal_rate")
             self.assertIn("latency_ms", payload)
 
+            with open(log, encoding="utf-8") as f:
+                self.assertIn("- INFO - Data processed: 4 rows, 2 signals", f.read())
+
     def test_missing_input_file_error(self):
         with tempfile.TemporaryDirectory() as td:
             config = os.path.join(td, "config.yaml")
@@ -62,9 +69,7 @@ class RunPyIntegrationTests(unittest.TestCase):
             with open(config, "w", encoding="utf-8") as f:
                 f.write('seed: 42\nwindow: 5\nversion: "v1"\n')
 
-            res = self.run_cmd([
-                "python",
-                "run.py",
+            returncode, stdout = self.run_cmd([
                 "--input",
                 os.path.join(td, "missing.csv"),
                 "--config",
@@ -73,9 +78,9 @@ class RunPyIntegrationTests(unittest.TestCase):
                 out,
                 "--log-file",
                 log,
-            ], cwd=os.getcwd())
+            ])
 
-            self.assertNotEqual(res.returncode, 0)
+            self.assertNotEqual(returncode, 0)
             payload = self.load_json(out)
             self.assertEqual(payload["status"], "error")
             self.assertIn("Missing input file", payload["error_message"])
@@ -94,9 +99,7 @@ class RunPyIntegrationTests(unittest.TestCase):
                 f.write("timestamp,open,high,low,volume_btc,volume_usd\n")
                 f.write("2024-01-01 00:00:00,1,1,1,1,1\n")
 
-            res = self.run_cmd([
-                "python",
-                "run.py",
+            returncode, stdout = self.run_cmd([
                 "--input",
                 data,
                 "--config",
@@ -105,9 +108,9 @@ class RunPyIntegrationTests(unittest.TestCase):
                 out,
                 "--log-file",
                 log,
-            ], cwd=os.getcwd())
+            ])
 
-            self.assertNotEqual(res.returncode, 0)
+            self.assertNotEqual(returncode, 0)
             payload = self.load_json(out)
             self.assertEqual(payload["status"], "error")
             self.assertIn("Missing required columns", payload["error_message"])
@@ -129,19 +132,201 @@ class RunPyIntegrationTests(unittest.TestCase):
                 for i, close in enumerate([10, 11, 12, 11, 10, 9, 10, 11]):
                     f.write(f"2024-01-01 00:0{i}:00,1,1,1,{close},1,1\n")
 
-            res1 = self.run_cmd([
-                "python", "run.py", "--input", data, "--config", config, "--output", out1, "--log-file", log1
-            ], cwd=os.getcwd())
-            res2 = self.run_cmd([
-                "python", "run.py", "--input", data, "--config", config, "--output", out2, "--log-file", log2
-            ], cwd=os.getcwd())
+            returncode1, _ = self.run_cmd([
+                "--input", data, "--config", config, "--output", out1, "--log-file", log1
+            ])
+            returncode2, _ = self.run_cmd([
+                "--input", data, "--config", config, "--output", out2, "--log-file", log2
+            ])
 
-            self.assertEqual(res1.returncode, 0)
-            self.assertEqual(res2.returncode, 0)
+            self.assertEqual(returncode1, 0)
+            self.assertEqual(returncode2, 0)
             payload1 = self.load_json(out1)
             payload2 = self.load_json(out2)
             self.assertEqual(payload1["value"], payload2["value"])
 
+    def test_quiet_prints_only_json(self):
+        with tempfile.TemporaryDirectory() as td:
+            config = os.path.join(td, "config.yaml")
+            data = os.path.join(td, "data.csv")
+            out = os.path.join(td, "metrics.json")
+            log = os.path.join(td, "run.log")
+
+            with open(config, "w", encoding="utf-8") as f:
+                f.write('seed: 42\nwindow: 3\nversion: "v1"\n')
+
+            with open(data, "w", encoding="utf-8") as f:
+                f.write("timestamp,open,high,low,close,volume_btc,volume_usd\n")
+                for i, close in enumerate([10, 11, 12, 11, 10, 9, 10, 11]):
+                    f.write(f"2024-01-01 00:0{i}:00,1,1,1,{close},1,1\n")
+
+            returncode, stdout = self.run_cmd([
+                "--input", data, "--config", config, "--output", out, "--log-file", log, "--quiet"
+            ])
+
+            self.assertEqual(returncode, 0, msg=stdout)
+            self.assertNotIn("- INFO -", stdout)
+            with open(out, encoding="utf-8") as f:
+                self.assertEqual(stdout, f.read() + "\n")
+            self.assertEqual(json.loads(stdout), self.load_json(out))
+
+            with open(log, encoding="utf-8") as f:
+                log_text = f.read()
+            self.assertIn("- INFO - Job started", log_text)
+            self.assertIn("- INFO - Job completed successfully", log_text)
+
+    def test_seed_beyond_64_bits_is_reported(self):
+        with tempfile.TemporaryDirectory() as td:
+            config = os.path.join(td, "config.yaml")
+            data = os.path.join(td, "data.csv")
+            out = os.path.join(td, "metrics.json")
+            log = os.path.join(td, "run.log")
+
+            with open(config, "w", encoding="utf-8") as f:
+                f.write('seed: 99999999999999999999\nwindow: 3\nversion: "v1"\n')
+
+            with open(data, "w", encoding="utf-8") as f:
+                f.write("timestamp,close\n")
+                for i, close in enumerate([10, 11, 12, 11]):
+                    f.write(f"2024-01-01 00:0{i}:00,{close}\n")
+
+            returncode, stdout = self.run_cmd([
+                "--input", data, "--config", config, "--output", out, "--log-file", log, "--quiet"
+            ])
+
+            self.assertEqual(returncode, 0, msg=stdout)
+            payload = self.load_json(out)
+            self.assertEqual(payload["status"], "success")
+            self.assertEqual(payload["seed"], 99999999999999999999)
+
+
+class RollingSignalTests(unittest.TestCase):
+    def test_two_sum_is_exact(self):
+        a = np.array([1e16, 0.1, -3.5, 1e300, 2.0 ** -60])
+        b = np.array([1.0, 0.2, 3.5 + 2.0 ** -50, -1e284, 1.0])
+        sums, errors = run._two_sum(a, b)
+        for x, e, ai, bi in zip(sums, errors, a, b):
+            self.assertEqual(Fraction(float(x)) + Fraction(float(e)), Fraction(float(ai)) + Fraction(float(bi)))
+
+    def test_two_product_is_exact(self):
+        a = np.array([0.1, -30005.58, 1e-300, 1e300, -3e302])
+        for b in [2.0, 3.0, 5000.0]:
+            products, errors = run._two_product(a, b)
+            for x, e, ai in zip(products, errors, a):
+                with self.subTest(a=float(ai), b=b):
+                    self.assertEqual(Fraction(float(x)) + Fraction(float(e)), Fraction(float(ai)) * Fraction(b))
+
+    def test_closes_above_split_limit(self):
+        self.assertEqual(run.compute_signals(np.array([1e300, 2e300, 1e300]), 2).tolist(), [0, 1, 0])
+
+    def test_tie_tolerance(self):
+        # 0.2 * 3 == 0.1 + 0.3 + 0.2 in decimal, but float64 parsing makes the product slightly larger.
+        self.assertEqual(run.compute_signals(np.array([0.1, 0.3, 0.2]), 3).tolist(), [0, 0, 0])
+        self.assertEqual(run.compute_signals(np.array([0.1, 0.3, 0.2000001]), 3).tolist(), [0, 0, 1])
+        # Differences below float64 input precision compare as equal; one more digit of precision does not.
+        self.assertEqual(run.compute_signals(np.array([1.0, np.nextafter(1.0, 2.0)]), 2).tolist(), [0, 0])
+        self.assertEqual(run.compute_signals(np.array([1.0, 1.0 + 1e-14]), 2).tolist(), [0, 1])
+
+    def test_large_window_matches_exact_rolling_mean(self):
+        rng = np.random.default_rng(0)
+        window = 5000
+        closes = [f"{value:.2f}" for value in rng.normal(100, 5, 12000)]
+        closes[6000:] = ["100.10"] * 6000
+
+        exact = [Fraction(close) for close in closes]
+        expected = [0] * (window - 1)
+        window_sum = sum(exact[:window - 1])
+        for i in range(window - 1, len(exact)):
+            window_sum += exact[i]
+            expected.append(int(exact[i] * window > window_sum))
+            window_sum -= exact[i - window + 1]
+
+        signals = run.compute_signals(np.array(closes, dtype=np.float64), window)
+        self.assertEqual(signals.tolist(), expected)
+
+    def test_chunk_boundaries_match_single_pass(self):
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with tempfile.TemporaryDirectory() as td:
+            small = os.path.join(td, "small.csv")
+            with open(small, "w", encoding="utf-8") as f:
+                f.write("timestamp,open,high,low,close,volume_btc,volume_usd\n")
+                for i, close in enumerate([10, 11, 12, 11, 10, 9, 10, 11]):
+                    f.write(f"2024-01-01 00:0{i}:00,1,1,1,{close},1,1\n")
+
+            # 500 rows of the bundled data.csv around its exact window=5 tie, to keep chunksize=1 fast.
+            sample = os.path.join(td, "sample.csv")
+            with open(os.path.join(repo_root, "data.csv"), encoding="utf-8") as f:
+                lines = f.readlines()
+            with open(sample, "w", encoding="utf-8") as f:
+                f.writelines([lines[0], *lines[7201:7701]])
+
+            for path, window in [(small, 3), (sample, 5)]:
+                closes = np.concatenate(list(run.load_and_validate_data(path)))
+                expected = int(run.compute_signals(closes, window).sum())
+                for chunksize in [1, window - 1, window, 7]:
+                    with self.subTest(path=os.path.basename(path), chunksize=chunksize):
+                        state = run.RollingSignalState(window)
+                        for chunk in run.load_and_validate_data(path, chunksize=chunksize):
+                            state.update(chunk)
+                        self.assertEqual(state.rows_processed, len(closes))
+                        self.assertEqual(state.signal_count, expected)
+
+
+    def test_window_spanning_many_chunks(self):
+        closes = np.round(np.random.default_rng(1).normal(100, 5, 3000), 2)
+        for window in [1000, 2999, 3000, 10 ** 11]:
+            with self.subTest(window=window):
+                state = run.RollingSignalState(window)
+                for start in range(0, len(closes), 64):
+                    state.update(closes[start:start + 64])
+                self.assertEqual(state.signal_count, run.compute_signal_count(closes, window))
+                self.assertLessEqual(state.prefixes.shape[1], 2 * (len(closes) + 1) + 64)
+
+class LoadDataTests(unittest.TestCase):
+    def load(self, text):
+        with tempfile.TemporaryDirectory() as td:
+            data = os.path.join(td, "data.csv")
+            with open(data, "w", encoding="utf-8") as f:
+                f.write(text)
+            return np.concatenate(list(run.load_and_validate_data(data, chunksize=2)))
+
+    def test_nan_close_values_are_accepted(self):
+        closes = self.load("ts,close\n1,1\n2,2\n3,3\n4,nan\n5,NaN\n6,-nan\n7,7\n")
+        self.assertEqual(np.isnan(closes).tolist(), [False, False, False, True, True, True, False])
+        # As with the original running sum, a NaN poisons every later window.
+        self.assertEqual(run.compute_signals(closes, 2).tolist(), [0, 1, 1, 0, 0, 0, 0])
+
+    def test_blank_and_na_close_values_are_rejected(self):
+        for value in ["", "NA", "null"]:
+            with self.subTest(value=value), self.assertRaises(run.PipelineError) as ctx:
+                self.load(f"ts,close\n1,1\n2,{value}\n")
+            self.assertEqual(str(ctx.exception), "Invalid close value: must be numeric")
+
+    def test_duplicate_close_header_uses_last_column(self):
+        closes = self.load("close,ts,close\n9,1,1\n9,2,2\n9,3,3\n")
+        self.assertEqual(closes.tolist(), [1.0, 2.0, 3.0])
+
+class DumpsJsonTests(unittest.TestCase):
+    payload = {"version": "v\u00e9", "rows_processed": 4, "value": 0.5006, "seed": -3, "status": "success"}
+    expected = (
+        '{\n  "version": "v\u00e9",\n  "rows_processed": 4,\n  "value": 0.5006,\n'
+        '  "seed": -3,\n  "status": "success"\n}'
+    ).encode("utf-8")
+
+    def test_stdlib_backend(self):
+        with patch.object(run, "orjson", None):
+            self.assertEqual(run.dumps_json(self.payload), self.expected)
+
+    @unittest.skipIf(run.orjson is None, "orjson is not installed")
+    def test_orjson_backend(self):
+        self.assertEqual(run.dumps_json(self.payload), self.expected)
+
+    def test_integer_beyond_64_bits(self):
+        payload = {"seed": 10 ** 20}
+        for backend in [run.orjson, None]:
+            with self.subTest(orjson=backend is not None), patch.object(run, "orjson", backend):
+                self.assertEqual(run.dumps_json(payload), b'{\n  "seed": 100000000000000000000\n}')
+
 
 if __name__ == "__main__":
     unittest.main()